@@ -9,6 +9,9 @@
 #    - Cambia 'usar_archivo_csv = False' 
 #    - Modifica los valores de voltajes y corrientes abajo
 #
+# 4. OPCIÓN C: Serie por intensidad (misma celda a varias irradiancias)
+#    - Llena 'curvas_serie' más abajo; si tiene curvas, se usa en lugar de A y B
+#
 # IMPORTANTE: Los datos deben tener el mismo número de valores para voltaje y corriente
 
 # ==========================================
@@ -35,6 +38,33 @@ voltajes = [0.0, 0.1, 0.2, 0.3, 0.4, 0.5]
 # Datos medidos de corriente (A) - separados por comas  
 corrientes = [0.5, 0.48, 0.45, 0.40, 0.30, 0.0]
 
+# ==========================================
+# SERIE POR INTENSIDAD (Suns-Voc / factor de idealidad)
+# ==========================================
+
+# Curvas de la misma celda a distintas irradiancias (W/m²). Deja la lista vacía
+# para el análisis de una sola curva. Cada curva usa 'archivo_csv' o
+# 'voltajes'/'corrientes'; 'nombre' es opcional. Ejemplo:
+# curvas_serie = [
+#     {'archivo_csv': "celda_100W.csv", 'irradiancia': 100},
+#     {'archivo_csv': "celda_500W.csv", 'irradiancia': 500},
+#     {'archivo_csv': "celda_1000W.csv", 'irradiancia': 1000},
+# ]
+curvas_serie = []
+
+# Unidad de las corrientes de la serie: "A" o "mA"
+unidad_corriente_serie = "A"
+
+# Área activa de la celda en cm² (¡no en m²!). None si las corrientes
+# ya son densidades de corriente (A/cm² o mA/cm²)
+area_celda_cm2 = None
+
+# Temperatura de la celda durante la medición (K)
+temperatura_celda = 298.15
+
+# Nombre del archivo de la gráfica de la serie
+titulo_serie = "serie_intensidad.png"
+
 # ==========================================
 # CONFIGURACIÓN DEL ANÁLISIS
 # ==========================================
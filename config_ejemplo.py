@@ -45,6 +45,16 @@ irradiancia = 1000
 # Ejemplos: 0.01 = 1 cm², 0.0025 = 0.25 cm², 0.04 = 4 cm²
 area_celda = 0.01
 
+# Serie por intensidad: misma celda medida a varias irradiancias (W/m²)
+# Deja la lista vacía para analizar una sola curva
+curvas_serie = []
+# curvas_serie = [
+#     {'archivo_csv': "celda_100W.csv", 'irradiancia': 100},
+#     {'archivo_csv': "celda_1000W.csv", 'irradiancia': 1000, 'nombre': "STC"},
+# ]
+unidad_corriente_serie = "A"  # Unidad de las corrientes de la serie: "A" o "mA"
+area_celda_cm2 = 1            # Área en cm² para la serie (1 = 1 cm², ¡no en m²!)
+
 # =====================================================
 # 🎨 CONFIGURACIÓN DE GRÁFICAS
 # =====================================================
@@ -13,6 +13,7 @@ Fecha: 2025
 Funcionalidades:
 - Análisis de curvas I-V y P-V
 - Cálculo de parámetros característicos (Isc, Voc, Pmax, FF, η)
+- Análisis en serie por intensidad (factor de idealidad y recombinación)
 - Generación de gráficas profesionales
 - Exportación de resultados a CSV
 - Configuración fácil de datos de entrada
@@ -35,6 +36,10 @@ import os
 import pandas as pd
 from datetime import datetime
 
+# Constantes físicas para el análisis de idealidad
+K_BOLTZMANN = 1.380649e-23   # J/K
+Q_ELECTRON = 1.602176634e-19  # C
+
 
 def analiza_celda(voltage, current, 
                   titulo="Análisis de Celda Solar", mostrar_eficiencia=True, 
@@ -199,6 +204,205 @@ def analiza_celda(voltage, current,
     return resultados, fig
 
 
+def _interpola_en_cero(x, y):
+    """
+    Interpola linealmente y(x=0) para cada fila de matrices rellenas con NaN,
+    extrapolando con el primer o último segmento como interp1d.
+    """
+    orden = np.argsort(x, axis=1)  # Los NaN quedan al final de cada fila
+    x = np.take_along_axis(x, orden, axis=1)
+    y = np.take_along_axis(y, orden, axis=1)
+    filas = np.arange(x.shape[0])
+    n_validos = np.sum(~np.isnan(x), axis=1)
+
+    j = np.clip(np.sum(x <= 0.0, axis=1) - 1, 0, n_validos - 2)
+    x0, x1 = x[filas, j], x[filas, j + 1]
+    y0, y1 = y[filas, j], y[filas, j + 1]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return y0 + (0.0 - x0) * (y1 - y0) / (x1 - x0)
+
+
+def analiza_serie_intensidad(curvas, area_celda_cm2=None, unidad_corriente='mA',
+                             temperatura=298.15, titulo="Análisis de Serie por Intensidad",
+                             guardar_imagen=True):
+    """
+    Analiza una serie de curvas I-V de la misma celda medidas a distintas
+    irradiancias, calculando los parámetros de todas en una sola pasada vectorizada.
+
+    Parámetros:
+    -----------
+    curvas : list of dict
+        Cada curva con las claves 'voltajes', 'corrientes' e 'irradiancia' (W/m²)
+        y opcionalmente 'nombre' para identificarla en la tabla (por defecto su índice).
+    area_celda_cm2 : float, opcional
+        Área activa en cm². Si se indica, las corrientes son absolutas y se dividen
+        entre el área; si no, se asume que ya son densidades de corriente (por cm²).
+    unidad_corriente : str
+        'A' o 'mA', unidad de las corrientes medidas. Se convierten a mA (mA/cm²).
+    temperatura : float
+        Temperatura de la celda en K para el voltaje térmico kT/q.
+
+    Ajusta Voc vs ln(intensidad) para obtener el factor de idealidad n y
+    Jsc vs intensidad (ley de potencias Jsc ∝ G^α) como indicadores de recombinación.
+    Retorna la tabla consolidada (DataFrame), el resumen del ajuste y la figura.
+    """
+    if len(curvas) < 2:
+        raise ValueError("Se requieren al menos 2 curvas para el análisis de serie")
+    if unidad_corriente not in ('A', 'mA'):
+        raise ValueError(f"Unidad de corriente no soportada: {unidad_corriente!r} (usa 'A' o 'mA')")
+    irradiancias = []
+    for curva in curvas:
+        if len(curva['voltajes']) != len(curva['corrientes']):
+            raise ValueError("Los arrays de voltaje y corriente deben tener la misma longitud")
+        if len(curva['voltajes']) < 3:
+            raise ValueError("Se requieren al menos 3 puntos de medición")
+        try:
+            irradiancia = float(curva['irradiancia'])
+        except (TypeError, ValueError):
+            raise ValueError(f"La irradiancia debe ser un número: {curva['irradiancia']!r}")
+        if not irradiancia > 0:
+            raise ValueError("La irradiancia debe ser mayor que cero")
+        irradiancias.append(irradiancia)
+
+    # Matrices (curvas x puntos) rellenas con NaN para procesar todo a la vez
+    n_max = max(len(c['voltajes']) for c in curvas)
+    V = np.full((len(curvas), n_max), np.nan)
+    I = np.full((len(curvas), n_max), np.nan)
+    for k, curva in enumerate(curvas):
+        V[k, :len(curva['voltajes'])] = curva['voltajes']
+        I[k, :len(curva['corrientes'])] = curva['corrientes']
+    G = np.array(irradiancias)
+
+    if unidad_corriente == 'A':
+        I = I * 1000  # A -> mA
+    if area_celda_cm2 is not None:
+        if area_celda_cm2 <= 0:
+            raise ValueError("El área de la celda debe ser mayor que cero")
+        I = I / area_celda_cm2
+
+    # --- Parámetros de todas las curvas (mismo criterio que analiza_celda) ---
+    Jsc = _interpola_en_cero(V, I)
+    Voc = _interpola_en_cero(I, V)
+
+    I_inver = -I
+    P = V * I_inver
+    idx_max = np.nanargmax(P, axis=1)
+    filas = np.arange(len(curvas))
+    Vmp = V[filas, idx_max]
+    Imp = I_inver[filas, idx_max]
+    Pmax = Vmp * Imp
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        FF = np.where((Jsc != 0) & (Voc != 0),
+                      np.abs(Pmax) / (np.abs(Jsc) * np.abs(Voc)) * 100, 0.0)
+
+    # Eficiencia absoluta: irradiancia W/m² -> mW/cm² (1 W/m² = 0.1 mW/cm²)
+    eficiencia = np.abs(Pmax) / (G * 0.1) * 100
+
+    tabla = pd.DataFrame({
+        'Curva': [str(c.get('nombre', k)) for k, c in enumerate(curvas)],
+        'Irradiancia': G,
+        'Jsc': np.abs(Jsc),
+        'Voc': np.abs(Voc),
+        'Imp': np.abs(Imp),
+        'Vmp': np.abs(Vmp),
+        'Pmax': np.abs(Pmax),
+        'FF': FF,
+        'Eficiencia': eficiencia,
+    }).sort_values('Irradiancia', kind='stable').reset_index(drop=True)
+
+    # --- Ajustes dependientes de la intensidad ---
+    # Curvas oscuras o sin cruce por cero dan Jsc = 0 o Voc no finito y arruinarían el ajuste
+    validas = tabla[np.isfinite(tabla['Voc']) & np.isfinite(tabla['Jsc']) & (tabla['Jsc'] > 0)]
+    descartadas = tabla.loc[~tabla.index.isin(validas.index)]
+    if len(descartadas) > 0:
+        lista = ", ".join(f"{fila.Irradiancia:g} W/m² ({fila.Curva})" for fila in descartadas.itertuples())
+        print(f"⚠️  Curvas descartadas del ajuste (Jsc nulo o Voc no válido): {lista}")
+    irreales = tabla[tabla['Eficiencia'] > 100]
+    if len(irreales) > 0:
+        lista = ", ".join(f"{fila.Irradiancia:g} W/m² ({fila.Curva})" for fila in irreales.itertuples())
+        print(f"⚠️  Eficiencia mayor a 100% en: {lista}. Revisa area_celda_cm2 y unidad_corriente")
+    if validas['Irradiancia'].nunique() < 2:
+        raise ValueError("Se requieren al menos 2 niveles de irradiancia distintos con Jsc y Voc válidos")
+    Vt = K_BOLTZMANN * temperatura / Q_ELECTRON
+    ln_G = np.log(validas['Irradiancia'].to_numpy())
+    pendiente_voc, ordenada_voc = np.polyfit(ln_G, validas['Voc'].to_numpy(), 1)
+    alfa, ln_k = np.polyfit(ln_G, np.log(validas['Jsc'].to_numpy()), 1)
+
+    ajuste = {
+        'n': pendiente_voc / Vt,               # ~1 radiativa, ~2 asistida por trampas (SRH)
+        'PendienteVoc': pendiente_voc,          # V por década natural de intensidad
+        'OrdenadaVoc': ordenada_voc,
+        'Alfa': alfa,                           # <1 indica recombinación bimolecular
+        'CoefJsc': np.exp(ln_k),
+        'VoltajeTermico': Vt,
+    }
+
+    # Mostrar resultados
+    print("=" * 50)
+    print(f"🔋 {titulo}")
+    print("=" * 50)
+    print(f"📊 Analizando {len(curvas)} curvas a distintas irradiancias...")
+    print(f"📅 Fecha de análisis: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+    print("📈 PARÁMETROS POR IRRADIANCIA:")
+    print(tabla.to_string(index=False, float_format=lambda x: f"{x:.4f}"))
+    print()
+    print("🔬 DEPENDENCIA CON LA INTENSIDAD:")
+    print(f"  • n (Factor de idealidad, Voc vs ln G): {ajuste['n']:.3f}")
+    print(f"  • α (Exponente Jsc ∝ G^α): {ajuste['Alfa']:.3f}")
+    print()
+
+    # Exportar la tabla consolidada a CSV
+    print("💾 Exportando resultados a CSV...")
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    archivo_csv = f"resultados_serie_{timestamp}.csv"
+    try:
+        tabla_csv = tabla.assign(n=ajuste['n'], Alfa=ajuste['Alfa'])
+        tabla_csv.to_csv(archivo_csv, index=False, float_format="%.4f", encoding='utf-8')
+        print(f"✅ Resultados guardados en: {archivo_csv}")
+    except Exception as e:
+        print(f"❌ Error al guardar CSV: {e}")
+
+    # Generar figura de los ajustes
+    print("📈 Generando gráficas (retornando objetos de figura)...")
+    try:
+        fig, ax = plt.subplots(1, 2, figsize=(14, 6))
+        fig.suptitle(titulo, fontsize=16, fontweight='bold')
+
+        G_fino = np.linspace(validas['Irradiancia'].min(), validas['Irradiancia'].max(), 100)
+
+        ax[0].semilogx(validas['Irradiancia'], validas['Voc'], 'o', markersize=8, color='#2E86AB', label='Voc medido')
+        ax[0].semilogx(G_fino, pendiente_voc * np.log(G_fino) + ordenada_voc, 'k--',
+                       label=f"Ajuste: n = {ajuste['n']:.2f}")
+        ax[0].set_title("Voc vs Intensidad", fontweight='bold')
+        ax[0].set_xlabel("Irradiancia (W/m²)")
+        ax[0].set_ylabel("Voltaje (V)")
+        ax[0].grid(True, alpha=0.3)
+        ax[0].legend(frameon=True, fancybox=True, shadow=True)
+
+        ax[1].loglog(validas['Irradiancia'], validas['Jsc'], 's', markersize=8, color='#A23B72', label='Jsc medido')
+        ax[1].loglog(G_fino, ajuste['CoefJsc'] * G_fino ** alfa, 'k--',
+                     label=f"Ajuste: α = {alfa:.2f}")
+        ax[1].set_title("Jsc vs Intensidad", fontweight='bold')
+        ax[1].set_xlabel("Irradiancia (W/m²)")
+        ax[1].set_ylabel("Densidad de corriente (mA/cm²)")
+        ax[1].grid(True, alpha=0.3, which='both')
+        ax[1].legend(frameon=True, fancybox=True, shadow=True)
+
+        plt.tight_layout()
+        if guardar_imagen:
+            nombre_archivo = titulo if titulo.endswith('.png') else "serie_intensidad.png"
+            fig.savefig(nombre_archivo, dpi=300)
+            print(f"✅ Gráfica guardada como: {nombre_archivo}")
+        print("✅ Figuras generadas y retornadas")
+    except Exception as e:
+        print(f"❌ Error al generar gráficas: {e}")
+        fig = None
+
+    print("\n🎉 Análisis de serie completado exitosamente!")
+    return tabla, ajuste, fig
+
+
 def cargar_datos_csv(archivo_csv):
     """
     Carga datos de voltaje y corriente desde un archivo CSV/TSV con detección automática de formato,
@@ -398,6 +602,86 @@ def cargar_configuracion():
         return None
 
 
+def cargar_configuracion_serie():
+    """
+    Carga la serie de curvas por intensidad definida en 'curvas_serie' de config.py.
+
+    Cada entrada indica 'irradiancia' (W/m²) y sus datos, ya sea con 'archivo_csv'
+    o con 'voltajes' y 'corrientes'; 'nombre' es opcional.
+
+    Retorna:
+    --------
+    dict : Diccionario con las curvas y opciones de la serie, o None si no hay serie
+    """
+    curvas_config = getattr(config, 'curvas_serie', [])
+    if not curvas_config:
+        return None
+
+    curvas = []
+    for k, entrada in enumerate(curvas_config):
+        if 'irradiancia' not in entrada:
+            print(f"❌ Error: La curva {k} de 'curvas_serie' no indica 'irradiancia'")
+            return None
+
+        if 'archivo_csv' in entrada:
+            archivo_csv = entrada['archivo_csv']
+            if not os.path.exists(archivo_csv):
+                print(f"❌ No se encontró el archivo de la serie: {archivo_csv}")
+                return None
+            voltajes, corrientes = cargar_datos_csv(archivo_csv)
+            nombre = entrada.get('nombre', os.path.basename(archivo_csv))
+        else:
+            voltajes = entrada.get('voltajes', [])
+            corrientes = entrada.get('corrientes', [])
+            nombre = entrada.get('nombre', str(k))
+
+        if not voltajes or not corrientes:
+            print(f"❌ Error: La curva '{nombre}' no contiene datos válidos")
+            return None
+        if len(voltajes) != len(corrientes):
+            print(f"❌ Error: La curva '{nombre}' tiene número diferente de valores de voltaje ({len(voltajes)}) y corriente ({len(corrientes)})")
+            return None
+        if len(voltajes) < 3:
+            print(f"❌ Error: La curva '{nombre}' necesita al menos 3 puntos de datos para el análisis")
+            return None
+        try:
+            irradiancia = float(entrada['irradiancia'])
+        except (TypeError, ValueError):
+            print(f"❌ Error: La irradiancia de la curva '{nombre}' no es un número: {entrada['irradiancia']!r}")
+            return None
+        if not irradiancia > 0:
+            print(f"❌ Error: La irradiancia de la curva '{nombre}' debe ser mayor que cero")
+            return None
+
+        curvas.append({
+            'voltajes': voltajes,
+            'corrientes': corrientes,
+            'irradiancia': irradiancia,
+            'nombre': nombre
+        })
+
+    if len(curvas) < 2:
+        print("❌ Error: Se necesitan al menos 2 curvas en 'curvas_serie' para el análisis de serie")
+        return None
+    if len({c['irradiancia'] for c in curvas}) < 2:
+        print("❌ Error: Se necesitan al menos 2 niveles de irradiancia distintos en 'curvas_serie'")
+        return None
+    unidad_corriente = getattr(config, 'unidad_corriente_serie', 'A')
+    if unidad_corriente not in ('A', 'mA'):
+        print(f"❌ Error: 'unidad_corriente_serie' debe ser \"A\" o \"mA\", no {unidad_corriente!r}")
+        return None
+
+    print(f"✅ Serie cargada: {len(curvas)} curvas desde config.py")
+    return {
+        'curvas': curvas,
+        'area_celda_cm2': getattr(config, 'area_celda_cm2', None),
+        'unidad_corriente': unidad_corriente,
+        'temperatura': getattr(config, 'temperatura_celda', 298.15),
+        'titulo_grafica': getattr(config, 'titulo_serie', "serie_intensidad.png"),
+        'guardar_imagen': getattr(config, 'guardar_imagen', True)
+    }
+
+
 def main():
     """
     Función principal del programa.
@@ -406,34 +690,52 @@ def main():
     print("   ANALIZADOR DE CELDAS SOLARES - ADRIANA RAZO DE LEÓN")
     print("🔋" + "="*58 + "🔋\n")
     
-    config_data = cargar_configuracion()
-    
-    if config_data and config_data['voltajes'] and config_data['corrientes']:
-        fuente = config_data.get('fuente_datos', 'configuración')
-        print(f"📂 Usando datos de: {fuente}")
-        resultados, _ = analiza_celda(
-            voltage=config_data['voltajes'],
-            current=config_data['corrientes'],
-            titulo=config_data['titulo_grafica'],
-            mostrar_eficiencia=config_data['mostrar_eficiencia'],
-            guardar_imagen=config_data['guardar_imagen']
-        )
-    else:
-        print("📊 Usando datos de ejemplo")
-        print("💡 Para usar tus propios datos, modifica el archivo config.py\n")
-        V_ejemplo = [0.0, 0.1, 0.2, 0.3, 0.4, 0.5]
-        I_ejemplo = [0.5, 0.48, 0.45, 0.40, 0.30, 0.0]
+    serie_data = cargar_configuracion_serie()
+    if serie_data:
+        print("📂 Usando serie por intensidad de: config.py (curvas_serie)")
+        try:
+            resultados, _, _ = analiza_serie_intensidad(
+                curvas=serie_data['curvas'],
+                area_celda_cm2=serie_data['area_celda_cm2'],
+                unidad_corriente=serie_data['unidad_corriente'],
+                temperatura=serie_data['temperatura'],
+                titulo=serie_data['titulo_grafica'],
+                guardar_imagen=serie_data['guardar_imagen']
+            )
+        except ValueError as e:
+            print(f"❌ Error en el análisis de serie: {e}")
+            serie_data = None
+    if getattr(config, 'curvas_serie', []) and not serie_data:
+        print("💡 Revisa 'curvas_serie' en config.py, cambiando al análisis de una sola curva...")
+    if not serie_data:
+        config_data = cargar_configuracion()
+        if config_data and config_data['voltajes'] and config_data['corrientes']:
+            fuente = config_data.get('fuente_datos', 'configuración')
+            print(f"📂 Usando datos de: {fuente}")
+            resultados, _ = analiza_celda(
+                voltage=config_data['voltajes'],
+                current=config_data['corrientes'],
+                titulo=config_data['titulo_grafica'],
+                mostrar_eficiencia=config_data['mostrar_eficiencia'],
+                guardar_imagen=config_data['guardar_imagen']
+            )
+        else:
+            print("📊 Usando datos de ejemplo")
+            print("💡 Para usar tus propios datos, modifica el archivo config.py\n")
+            V_ejemplo = [0.0, 0.1, 0.2, 0.3, 0.4, 0.5]
+            I_ejemplo = [0.5, 0.48, 0.45, 0.40, 0.30, 0.0]
     
-        resultados, _ = analiza_celda(
-            voltage=V_ejemplo,
-            current=I_ejemplo,
-            titulo="Análisis de Celda Solar (Datos de Ejemplo)"
-        )
+            resultados, _ = analiza_celda(
+                voltage=V_ejemplo,
+                current=I_ejemplo,
+                titulo="Análisis de Celda Solar (Datos de Ejemplo)"
+            )
     
     print("\n📝 INFORMACIÓN ADICIONAL:")
     print("-" * 40)
     print("• Para usar datos CSV: cambia 'usar_archivo_csv = True' en config.py")
     print("• Para datos directos: modifica los arrays en config.py")
+    print("• Para una serie por intensidad: llena 'curvas_serie' en config.py")
     print("• Los resultados se guardan automáticamente en formato CSV")
     print("• Las gráficas se guardan como archivos PNG")
     print("• Consulta el README.md para más información")